@@ -4,8 +4,10 @@ from .pump_ranking_analyzer import PumpRankingAnalyzer
 from .signal_analyzer import SignalAnalyzer
 from .volume_profile_analyzer import VolumeProfileAnalyzer
 from .data_fetcher import DataFetcher
+from .columnar import OHLCVBuffer
 
 __all__ = [
+    'OHLCVBuffer',
     'TechnicalAnalyzer',
     'FundamentalAnalyzer',
     'PumpRankingAnalyzer',
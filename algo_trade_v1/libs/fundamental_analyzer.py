@@ -30,16 +30,20 @@ class FundamentalAnalyzer:
             pandas.DataFrame: DataFrame with fundamental trend analysis
         """
         # Calculate market metrics
-        df['market_cap'] = df['close'] * df['volume']  # Simplified market cap
-        df['liquidity_24h'] = df['volume'] * df['close']  # 24h volume in USD
-        
-        # Calculate trend metrics
-        df['market_cap_trend'] = df['market_cap'].pct_change(periods=20)
-        df['liquidity_trend'] = df['liquidity_24h'].pct_change(periods=20)
-        
+        market_cap = df['close'] * df['volume']  # Simplified market cap
+        liquidity_24h = df['volume'] * df['close']  # 24h volume in USD
+
+        # Attach metrics and trend columns in one batched assign
+        df = df.assign(
+            market_cap=market_cap,
+            liquidity_24h=liquidity_24h,
+            market_cap_trend=market_cap.pct_change(periods=20),
+            liquidity_trend=liquidity_24h.pct_change(periods=20)
+        )
+
         # Calculate fundamental score
         df['fundamental_score'] = self._calculate_fundamental_score(df)
-        
+
         return df
     
     def analyze_volume(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -53,15 +57,19 @@ class FundamentalAnalyzer:
             pandas.DataFrame: DataFrame with fundamental volume analysis
         """
         # Calculate volume metrics
-        df['volume_ma_20'] = df['volume'].rolling(window=20).mean()
-        df['volume_std_20'] = df['volume'].rolling(window=20).std()
-        
-        # Calculate volume trend
-        df['volume_trend'] = df['volume'] / df['volume_ma_20']
-        
+        volume_ma_20 = df['volume'].rolling(window=20).mean()
+
+        # Attach metrics and trend columns in one batched assign
+        df = df.assign(
+            volume_ma_20=volume_ma_20,
+            volume_std_20=df['volume'].rolling(window=20).std(),
+            # Calculate volume trend
+            volume_trend=df['volume'] / volume_ma_20
+        )
+
         # Calculate volume score
         df['volume_score'] = self._calculate_volume_score(df)
-        
+
         return df
     
     def _calculate_fundamental_score(self, df: pd.DataFrame) -> float:
@@ -75,17 +83,20 @@ class FundamentalAnalyzer:
             float: Fundamental score (0-1)
         """
         score = 0
-        
+
+        # One last-row extraction instead of a column indexer per check
+        last = df[['market_cap', 'liquidity_24h', 'volume_trend']].iloc[-1].to_dict()
+
         # Market cap score
-        if df['market_cap'].iloc[-1] > self.market_cap_threshold:
+        if last['market_cap'] > self.market_cap_threshold:
             score += self.weights['market_cap']
-            
+
         # Liquidity score
-        if df['liquidity_24h'].iloc[-1] > self.liquidity_threshold:
+        if last['liquidity_24h'] > self.liquidity_threshold:
             score += self.weights['liquidity']
-            
+
         # Volume trend score
-        if df['volume_trend'].iloc[-1] > self.volume_threshold:
+        if last['volume_trend'] > self.volume_threshold:
             score += self.weights['volume']
             
         # Additional metrics can be added here
@@ -104,21 +115,24 @@ class FundamentalAnalyzer:
             float: Volume score (0-1)
         """
         score = 0
-        
+
+        # One last-row extraction instead of a column indexer per check
+        last = df[['volume_trend', 'volume_std_20', 'volume_ma_20']].iloc[-1].to_dict()
+
         # Volume trend score
-        if df['volume_trend'].iloc[-1] >= 2.0:
+        if last['volume_trend'] >= 2.0:
             score += 0.4
-        elif df['volume_trend'].iloc[-1] >= 1.5:
+        elif last['volume_trend'] >= 1.5:
             score += 0.3
-        elif df['volume_trend'].iloc[-1] >= 1.2:
+        elif last['volume_trend'] >= 1.2:
             score += 0.2
-            
+
         # Volume consistency score
-        if df['volume_std_20'].iloc[-1] < df['volume_ma_20'].iloc[-1] * 0.5:
+        if last['volume_std_20'] < last['volume_ma_20'] * 0.5:
             score += 0.3
-        elif df['volume_std_20'].iloc[-1] < df['volume_ma_20'].iloc[-1]:
+        elif last['volume_std_20'] < last['volume_ma_20']:
             score += 0.2
-            
+
         return min(score, 1.0)
     
     def get_fundamental_metrics(self, df: pd.DataFrame) -> Dict:
@@ -131,10 +145,6 @@ class FundamentalAnalyzer:
         Returns:
             dict: Current fundamental metrics
         """
-        return {
-            'market_cap': df['market_cap'].iloc[-1],
-            'liquidity_24h': df['liquidity_24h'].iloc[-1],
-            'volume_trend': df['volume_trend'].iloc[-1],
-            'fundamental_score': df['fundamental_score'].iloc[-1],
-            'volume_score': df['volume_score'].iloc[-1]
-        } 
\ No newline at end of file
+        # Single last-row extraction and box pass for all five metrics
+        return df[['market_cap', 'liquidity_24h', 'volume_trend',
+                   'fundamental_score', 'volume_score']].iloc[-1].to_dict() 
\ No newline at end of file
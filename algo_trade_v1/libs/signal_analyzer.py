@@ -3,13 +3,90 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import json
+from numba import njit
 from .technical_analyzer import TechnicalAnalyzer
 from .volume_profile_analyzer import VolumeProfileAnalyzer
 from .fundamental_analyzer import FundamentalAnalyzer
 
+@njit(cache=True, fastmath=True)
+def _signal_strength_kernel(flags, trend_strength, rsi, macd, macd_signal,
+                            fundamental_score, va_position, close, vwap,
+                            hammer, morning_star, engulfing, doji,
+                            rsi_oversold, w_technical, w_fundamental,
+                            w_volume_profile, w_patterns):
+    """
+    Compute signal strength (0-100%) for every flagged row
+
+    Scalar replica of calculate_signal_strength over plain ndarrays so the
+    per-row scoring runs as one compiled loop instead of pandas dispatch.
+    """
+    n = flags.shape[0]
+    strength = np.zeros(n, dtype=np.float64)
+
+    for i in range(n):
+        if not flags[i]:
+            continue
+
+        # Technical score
+        technical = 0.0
+        if trend_strength[i] > 80:
+            technical += 0.4
+        elif trend_strength[i] > 60:
+            technical += 0.3
+        if rsi[i] < rsi_oversold:
+            technical += 0.3
+        elif rsi[i] < 40:
+            technical += 0.2
+        if macd[i] > macd_signal[i] and macd[i] > 0:
+            technical += 0.3
+        elif macd[i] > macd_signal[i]:
+            technical += 0.2
+        technical = min(technical, 1.0)
+
+        # Fundamental score
+        fundamental = fundamental_score[i]
+
+        # Volume profile score
+        vp = 0.0
+        if va_position[i] < 0.2:
+            vp += 0.4
+        elif va_position[i] < 0.4:
+            vp += 0.3
+        elif va_position[i] > 0.8:
+            vp += 0.2
+        if close[i] > vwap[i]:
+            vp += 0.2
+        vp = min(vp, 1.0)
+
+        # Pattern score
+        pattern = 0.0
+        if hammer[i] or morning_star[i]:
+            pattern += 0.4
+        elif engulfing[i] == 1:
+            pattern += 0.3
+        elif doji[i]:
+            pattern += 0.2
+        pattern = min(pattern, 1.0)
+
+        total = (
+            technical * w_technical +
+            fundamental * w_fundamental +
+            vp * w_volume_profile +
+            pattern * w_patterns
+        )
+        strength[i] = total * 100
+
+    return strength
+
 class SignalAnalyzer:
-    def __init__(self):
-        """Initialize SignalAnalyzer with analyzers"""
+    def __init__(self, warmup=False):
+        """
+        Initialize SignalAnalyzer with analyzers
+
+        Args:
+            warmup (bool): Pre-compile the Numba scoring kernel so the
+                first real detect_signals call pays no JIT latency
+        """
         self.technical_analyzer = TechnicalAnalyzer()
         self.volume_analyzer = VolumeProfileAnalyzer()
         self.fundamental_analyzer = FundamentalAnalyzer()
@@ -29,20 +106,43 @@ class SignalAnalyzer:
             'volume_profile': 0.20, # 20%
             'patterns': 0.10        # 10%
         }
-    
-    def analyze_data(self, df: pd.DataFrame) -> pd.DataFrame:
+
+        if warmup:
+            self._warmup_kernel()
+
+    def _warmup_kernel(self):
+        """Trigger JIT compilation of the scoring kernel on dummy inputs"""
+        dummy = np.zeros(1, dtype=np.float64)
+        dummy_flag = np.ones(1, dtype=np.bool_)
+        _signal_strength_kernel(
+            dummy_flag, dummy, dummy, dummy, dummy, dummy, dummy, dummy,
+            dummy, dummy_flag, dummy_flag, dummy, dummy_flag,
+            self.rsi_oversold, self.weights['technical'],
+            self.weights['fundamental'], self.weights['volume_profile'],
+            self.weights['patterns']
+        )
+
+    def analyze_data(self, df: pd.DataFrame, precomputed_core: bool = False) -> pd.DataFrame:
         """
         Perform complete analysis on the data
-        
+
         Args:
             df (pandas.DataFrame): DataFrame with OHLCV data
-            
+            precomputed_core (bool): True when the fused kernel columns
+                were already assigned (e.g. by fused_analyze_batch), so
+                only the residual indicators need computing
+
         Returns:
             pandas.DataFrame: DataFrame with all analysis results
         """
         # Technical analysis
-        df = self.technical_analyzer.analyze_trend(df)
-        df = self.technical_analyzer.detect_candle_patterns(df)
+        if precomputed_core:
+            df = self.technical_analyzer.analyze_residual(df)
+        else:
+            df = self.technical_analyzer.analyze_trend(df)
+            df = self.technical_analyzer.analyze_momentum(df)
+            df = self.technical_analyzer.analyze_volatility(df)
+            df = self.technical_analyzer.detect_candle_patterns(df)
         df = self.technical_analyzer.analyze_volume(df)
         
         # Fundamental analysis
@@ -184,13 +284,28 @@ class SignalAnalyzer:
         
         # Add pre-pump signal column
         df['pre_pump_signal'] = conditions
-        
-        # Calculate signal strength for rows with pre-pump signals
-        df['signal_strength'] = 0.0
-        signal_rows = df[df['pre_pump_signal']].index
-        for idx in signal_rows:
-            df.loc[idx, 'signal_strength'] = self.calculate_signal_strength(df.loc[idx])
-        
+
+        # Calculate signal strength for rows with pre-pump signals via the
+        # compiled kernel (one contiguous pass instead of per-row .loc)
+        df['signal_strength'] = _signal_strength_kernel(
+            conditions.to_numpy(dtype=np.bool_),
+            df['trend_strength'].to_numpy(dtype=np.float64),
+            df['rsi'].to_numpy(dtype=np.float64),
+            df['macd'].to_numpy(dtype=np.float64),
+            df['macd_signal'].to_numpy(dtype=np.float64),
+            df['fundamental_score'].to_numpy(dtype=np.float64),
+            df['va_position'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            df['vwap'].to_numpy(dtype=np.float64),
+            df['hammer'].to_numpy(dtype=np.bool_),
+            df['morning_star'].to_numpy(dtype=np.bool_),
+            df['engulfing'].to_numpy(dtype=np.float64),
+            df['doji'].to_numpy(dtype=np.bool_),
+            self.rsi_oversold, self.weights['technical'],
+            self.weights['fundamental'], self.weights['volume_profile'],
+            self.weights['patterns']
+        )
+
         return df
 
     def format_signal_output(self, signal: pd.Series) -> Dict:
@@ -254,8 +369,9 @@ class SignalAnalyzer:
             'max_signal_strength': signals['signal_strength'].max()
         }
         
-        # Save signals
-        signals.to_csv(filename, index=False)
+        # Save signals (buffered + chunked, compact float formatting)
+        with open(filename, 'w', buffering=1 << 20, newline='') as f:
+            signals.to_csv(f, index=False, float_format='%.6g', chunksize=10000)
         
         # Save metadata
         metadata_filename = filename.replace('.csv', '_metadata.json')
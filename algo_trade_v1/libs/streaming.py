@@ -0,0 +1,193 @@
+import numpy as np
+
+class EMAState:
+    """
+    O(1) streaming exponential moving average
+
+    Maintains the adjust=False EMA recursion so one new price updates
+    the value in constant time instead of recomputing the full series.
+    Matches the ta-library EMA once seeded over the same history.
+    """
+
+    def __init__(self, window: int):
+        """
+        Initialize EMAState
+
+        Args:
+            window (int): EMA window (span)
+        """
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+        self.value = None
+        self.count = 0
+
+    def update(self, price: float) -> float:
+        """
+        Feed one new price and return the updated EMA
+
+        Args:
+            price (float): Latest close price
+
+        Returns:
+            float: Updated EMA value
+        """
+        if self.value is None:
+            self.value = float(price)
+        else:
+            self.value = self.alpha * price + (1.0 - self.alpha) * self.value
+        self.count += 1
+        return self.value
+
+    def seed(self, prices) -> "EMAState":
+        """
+        Seed the state from a price history
+
+        Args:
+            prices: Iterable of close prices in chronological order
+
+        Returns:
+            EMAState: self, for chaining
+        """
+        for price in prices:
+            self.update(price)
+        return self
+
+    @property
+    def ready(self) -> bool:
+        """True once the warmup window has been filled"""
+        return self.count >= self.window
+
+class RSIState:
+    """
+    O(1) streaming RSI with Wilder smoothing
+
+    Mirrors the ta-library convention: the first observation contributes
+    zero gain/loss, and the averages follow the alpha=1/window
+    adjust=False recursion.
+    """
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize RSIState
+
+        Args:
+            window (int): RSI lookback window
+        """
+        self.window = window
+        self.alpha = 1.0 / window
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.prev_close = None
+        self.count = 0
+
+    def update(self, close: float) -> float:
+        """
+        Feed one new close and return the updated RSI
+
+        Args:
+            close (float): Latest close price
+
+        Returns:
+            float: Updated RSI value (0-100)
+        """
+        if self.prev_close is not None:
+            diff = close - self.prev_close
+            gain = diff if diff > 0 else 0.0
+            loss = -diff if diff < 0 else 0.0
+            self.avg_gain = self.alpha * gain + (1.0 - self.alpha) * self.avg_gain
+            self.avg_loss = self.alpha * loss + (1.0 - self.alpha) * self.avg_loss
+        self.prev_close = float(close)
+        self.count += 1
+
+        if self.avg_loss == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+    def seed(self, closes) -> "RSIState":
+        """
+        Seed the state from a close-price history
+
+        Args:
+            closes: Iterable of close prices in chronological order
+
+        Returns:
+            RSIState: self, for chaining
+        """
+        for close in closes:
+            self.update(close)
+        return self
+
+    @property
+    def ready(self) -> bool:
+        """True once the warmup window has been filled"""
+        return self.count >= self.window
+
+class ATRState:
+    """
+    O(1) streaming Average True Range
+
+    SMA-seeded Wilder smoothing, matching the ta-library ATR: the first
+    window of true ranges is averaged, then each new bar updates the
+    value recursively in constant time.
+    """
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize ATRState
+
+        Args:
+            window (int): ATR smoothing window
+        """
+        self.window = window
+        self.value = 0.0
+        self.prev_close = None
+        self.count = 0
+        self._seed_sum = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Feed one new bar and return the updated ATR
+
+        Args:
+            high (float): Bar high
+            low (float): Bar low
+            close (float): Bar close
+
+        Returns:
+            float: Updated ATR value (0.0 during the seed window)
+        """
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = float(close)
+        self.count += 1
+
+        if self.count <= self.window:
+            self._seed_sum += tr
+            if self.count == self.window:
+                self.value = self._seed_sum / self.window
+        else:
+            self.value = (self.value * (self.window - 1) + tr) / self.window
+
+        return self.value
+
+    def seed(self, highs, lows, closes) -> "ATRState":
+        """
+        Seed the state from a bar history
+
+        Args:
+            highs: Iterable of bar highs in chronological order
+            lows: Iterable of bar lows in chronological order
+            closes: Iterable of bar closes in chronological order
+
+        Returns:
+            ATRState: self, for chaining
+        """
+        for high, low, close in zip(highs, lows, closes):
+            self.update(high, low, close)
+        return self
+
+    @property
+    def ready(self) -> bool:
+        """True once the warmup window has been filled"""
+        return self.count >= self.window
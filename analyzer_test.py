@@ -8,10 +8,39 @@ from libs.technical_analyzer import TechnicalAnalyzer
 from libs.fundamental_analyzer import FundamentalAnalyzer
 from libs.volume_profile_analyzer import VolumeProfileAnalyzer
 from libs.signal_analyzer import SignalAnalyzer
+from libs.columnar import OHLCVBuffer
+
+# Columns mirrored into the float32 columnar buffer for results extraction
+TECH_FIELDS = ['close', 'trend_strength', 'rsi', 'macd', 'macd_signal',
+               'bb_upper', 'bb_lower', 'atr']
+
+# Candle pattern names in pattern_bits bit order (bit 0 = hammer)
+PATTERN_NAMES = ['hammer', 'morning_star', 'engulfing', 'doji']
 
 # Load environment variables
 load_dotenv()
 
+# Module-level singletons: the ccxt client setup and Numba kernel
+# compilation are paid once at import instead of per analyze_coin call
+_FETCHER = DataFetcher(os.getenv('BINANCE_API_KEY'), os.getenv('BINANCE_API_SECRET'))
+_TECHNICAL = TechnicalAnalyzer()
+_FUNDAMENTAL = FundamentalAnalyzer()
+_VOLUME = VolumeProfileAnalyzer()
+_SIGNAL = SignalAnalyzer(warmup=True)
+
+def _warmup_kernels():
+    """Pre-compile the fused indicator kernel on a small dummy history"""
+    rng = np.random.default_rng(0)
+    closes = 100 + rng.standard_normal(60).cumsum()
+    dummy = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=60, freq='h'),
+        'open': closes, 'high': closes + 1, 'low': closes - 1,
+        'close': closes, 'volume': np.ones(60)
+    })
+    _TECHNICAL.fused_analyze(dummy)
+
+_warmup_kernels()
+
 def analyze_coin(symbol, timeframe=None, limit=None):
     """
     Analyze a single coin using all analyzers
@@ -36,12 +65,12 @@ def analyze_coin(symbol, timeframe=None, limit=None):
     print(f"Analyzing {symbol}...")
     print(f"{'='*50}")
     
-    # Initialize analyzers
-    data_fetcher = DataFetcher(os.getenv('BINANCE_API_KEY'), os.getenv('BINANCE_API_SECRET'))
-    technical_analyzer = TechnicalAnalyzer()
-    fundamental_analyzer = FundamentalAnalyzer()
-    volume_analyzer = VolumeProfileAnalyzer()
-    signal_analyzer = SignalAnalyzer()
+    # Shared analyzer singletons (constructed once at module import)
+    data_fetcher = _FETCHER
+    technical_analyzer = _TECHNICAL
+    fundamental_analyzer = _FUNDAMENTAL
+    volume_analyzer = _VOLUME
+    signal_analyzer = _SIGNAL
     
     # Fetch data
     print(f"\nFetching {symbol} data...")
@@ -50,12 +79,9 @@ def analyze_coin(symbol, timeframe=None, limit=None):
         print(f"Failed to fetch data for {symbol}")
         return None
     
-    # Technical Analysis
+    # Technical Analysis (single fused pass over the price arrays)
     print("\nPerforming Technical Analysis...")
-    df = technical_analyzer.analyze_trend(df)
-    df = technical_analyzer.analyze_momentum(df)
-    df = technical_analyzer.analyze_volatility(df)
-    df = technical_analyzer.detect_candle_patterns(df)
+    df = technical_analyzer.fused_analyze(df)
     
     # Get Fibonacci levels
     fib_levels = technical_analyzer.get_fibonacci_levels(df)
@@ -75,39 +101,47 @@ def analyze_coin(symbol, timeframe=None, limit=None):
     df = fundamental_analyzer.analyze_trend(df)
     fundamental_metrics = fundamental_analyzer.get_fundamental_metrics(df)
     
-    # Signal Analysis
+    # Signal Analysis (the fused pass above already computed the core
+    # indicator columns, so skip the chained ta recompute)
     print("\nGenerating Trading Signals...")
-    df = signal_analyzer.analyze_data(df)
+    df = signal_analyzer.analyze_data(df, precomputed_core=True)
     signals_df = signal_analyzer.detect_signals(df)
     
-    # Convert signals DataFrame to list of dictionaries
+    # Convert signals to a list of dictionaries: gather the signal row
+    # positions once with flatnonzero and index the needed column arrays
+    # directly, instead of materializing a filtered DataFrame copy
+    # through the block manager; patterns come from the packed
+    # pattern_bits column, one integer test per name
     signals = []
     if not signals_df.empty:
-        signal_rows = signals_df[signals_df['pre_pump_signal']]
-        for _, row in signal_rows.iterrows():
-            signals.append({
+        idx = np.flatnonzero(signals_df['pre_pump_signal'].to_numpy())
+        if idx.size:
+            strength = signals_df['signal_strength'].to_numpy()[idx]
+            price = signals_df['close'].to_numpy()[idx]
+            volume = signals_df['volume'].to_numpy()[idx]
+            pbits = signals_df['pattern_bits'].to_numpy(dtype=np.uint8)[idx]
+            signals = [{
                 'type': 'Pre-Pump',
-                'strength': row['signal_strength'],
-                'price': row['close'],
-                'volume': row['volume'],
-                'patterns': [
-                    pattern for pattern in ['hammer', 'morning_star', 'engulfing', 'doji']
-                    if row.get(pattern, False)
-                ]
-            })
-    
-    # Prepare results
+                'strength': strength[i],
+                'price': price[i],
+                'volume': volume[i],
+                'patterns': [PATTERN_NAMES[j] for j in range(4) if pbits[i] >> j & 1]
+            } for i in range(idx.size)]
+    
+    # Prepare results from a columnar float32 view of the indicator
+    # columns (single copy out of pandas, then raw array reads)
+    buf = OHLCVBuffer.from_dataframe(df, TECH_FIELDS)
     results = {
         'symbol': symbol,
-        'current_price': df['close'].iloc[-1],
+        'current_price': float(buf.close[-1]),
         'technical_indicators': {
-            'trend_strength': df['trend_strength'].iloc[-1],
-            'rsi': df['rsi'].iloc[-1],
-            'macd': df['macd'].iloc[-1],
-            'macd_signal': df['macd_signal'].iloc[-1],
-            'bb_upper': df['bb_upper'].iloc[-1],
-            'bb_lower': df['bb_lower'].iloc[-1],
-            'atr': df['atr'].iloc[-1]
+            'trend_strength': float(buf.trend_strength[-1]),
+            'rsi': float(buf.rsi[-1]),
+            'macd': float(buf.macd[-1]),
+            'macd_signal': float(buf.macd_signal[-1]),
+            'bb_upper': float(buf.bb_upper[-1]),
+            'bb_lower': float(buf.bb_lower[-1]),
+            'atr': float(buf.atr[-1])
         },
         'fibonacci_levels': fib_levels,
         'volume_profile': volume_levels,
@@ -55,9 +55,11 @@ class DataFetcher:
         self.max_reconnect_attempts = 5
         self.reconnect_delay = 5  # seconds
         
-        # Rate limiting
+        # Rate limiting (lock serializes the check-sleep-update when one
+        # fetcher is shared across fetch threads)
         self.last_request_time = 0
         self.min_request_interval = 0.1  # 100ms between requests
+        self._rate_limit_lock = threading.Lock()
         
         # WebSocket ping/pong
         self.last_ping_time = 0
@@ -79,17 +81,64 @@ class DataFetcher:
     
     def _rate_limit(self):
         """Implement rate limiting to avoid API restrictions"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last_request)
-        
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
+
+            if time_since_last_request < self.min_request_interval:
+                time.sleep(self.min_request_interval - time_since_last_request)
+
+            self.last_request_time = time.time()
     
     def _get_cache_path(self, symbol: str, timeframe: str) -> str:
         """Get cache file path for a symbol and timeframe"""
         return os.path.join(self.cache_dir, f"{symbol.replace('/', '_')}_{timeframe}.csv")
+
+    def _get_parquet_cache_path(self, symbol: str, timeframe: str) -> str:
+        """Get Parquet cache file path for a symbol and timeframe"""
+        return os.path.join(self.cache_dir, f"{symbol.replace('/', '_')}_{timeframe}.parquet")
+
+    def _read_cache(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
+        """
+        Load cached history, preferring the Parquet cache over legacy CSV
+
+        Args:
+            symbol (str): Trading pair symbol
+            timeframe (str): Candle timeframe
+
+        Returns:
+            pandas.DataFrame: Cached OHLCV history, or None
+        """
+        parquet_path = self._get_parquet_cache_path(symbol, timeframe)
+        if os.path.exists(parquet_path):
+            try:
+                df = pd.read_parquet(parquet_path)
+                self.logger.info(f"Data loaded from cache for {symbol} {timeframe}")
+                return df
+            except Exception as e:
+                self.logger.error(f"Error loading Parquet cache: {str(e)}")
+
+        # Legacy CSV cache from runs before the Parquet switch
+        csv_path = self._get_cache_path(symbol, timeframe)
+        if os.path.exists(csv_path):
+            try:
+                df = pd.read_csv(csv_path)
+                df['timestamp'] = pd.to_datetime(df['timestamp'])
+                self.logger.info(f"Data loaded from cache for {symbol} {timeframe}")
+                return df
+            except Exception as e:
+                self.logger.error(f"Error loading cache: {str(e)}")
+
+        return None
+
+    def _write_cache(self, df: pd.DataFrame, symbol: str, timeframe: str):
+        """Persist history to the zstd-compressed Parquet cache"""
+        try:
+            df.to_parquet(self._get_parquet_cache_path(symbol, timeframe),
+                          index=False, compression='zstd')
+            self.logger.info(f"Data cached for {symbol} {timeframe}")
+        except Exception as e:
+            self.logger.error(f"Error writing Parquet cache: {str(e)}")
     
     def _save_to_cache(self, df: pd.DataFrame, symbol: str, timeframe: str):
         """Save data to cache"""
@@ -143,24 +192,30 @@ class DataFetcher:
                           periods: int = 1000, use_cache: bool = True) -> Optional[pd.DataFrame]:
         """
         Get historical OHLCV data for a symbol with caching support
-        
+
+        A Parquet-cached symbol only fetches from its cached tail bar
+        onward (usually a bar or two), so repeat scans cost one small
+        request instead of re-downloading the full history every run.
+
         Args:
             symbol (str): Trading pair symbol (e.g., 'BTCUSDT' or 'BTC/USDT')
             timeframe (str): Candle timeframe (e.g., '1m', '5m', '1h', '1d')
             periods (int): Number of periods to fetch
             use_cache (bool): Whether to use cached data
-            
+
         Returns:
             pandas.DataFrame: DataFrame with historical data
         """
         # Format symbol
         symbol = self._format_symbol(symbol)
-        
+
         if use_cache:
-            cached_data = self._load_from_cache(symbol, timeframe)
-            if cached_data is not None:
-                return cached_data
-        
+            cached_data = self._read_cache(symbol, timeframe)
+            # A cache shorter than the request can only ever grow forward
+            # through delta fetches, so backfill it with a full fetch
+            if cached_data is not None and len(cached_data) >= periods:
+                return self._refresh_cached_data(cached_data, symbol, timeframe, periods)
+
         try:
             self._rate_limit()
             ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=periods)
@@ -171,10 +226,10 @@ class DataFetcher:
                 
             df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
+
             # Save to cache
-            self._save_to_cache(df, symbol, timeframe)
-            
+            self._write_cache(df, symbol, timeframe)
+
             return df
         except ccxt.RateLimitExceeded:
             self.logger.warning("Rate limit exceeded, waiting before retry...")
@@ -183,7 +238,45 @@ class DataFetcher:
         except Exception as e:
             self.logger.error(f"Error fetching OHLCV data: {str(e)}")
             return None
-    
+
+    def _refresh_cached_data(self, cached: pd.DataFrame, symbol: str,
+                             timeframe: str, periods: int) -> pd.DataFrame:
+        """
+        Top up cached history with only the candles missing from its tail
+
+        Args:
+            cached (pandas.DataFrame): Cached OHLCV history
+            symbol (str): Trading pair symbol (CCXT format)
+            timeframe (str): Candle timeframe
+            periods (int): Number of periods the caller wants back
+
+        Returns:
+            pandas.DataFrame: Up-to-date history, trimmed to periods rows
+        """
+        # Start the delta at the last cached bar itself, not one bar past
+        # it: that bar was snapshotted while still forming, so it must be
+        # re-requested once closed or its stale close/volume would stay in
+        # the cache forever (the drop_duplicates below replaces it)
+        last_ts = cached['timestamp'].iloc[-1]
+        since = int(pd.Timestamp(last_ts).value // 10**6)
+
+        try:
+            self._rate_limit()
+            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=periods)
+        except Exception as e:
+            # Serve the cached history rather than failing the whole scan
+            self.logger.error(f"Error fetching OHLCV delta: {str(e)}")
+            return cached.tail(periods).reset_index(drop=True)
+
+        if ohlcv:
+            delta = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+            delta['timestamp'] = pd.to_datetime(delta['timestamp'], unit='ms')
+            cached = pd.concat([cached, delta], ignore_index=True)
+            cached = cached.drop_duplicates(subset='timestamp', keep='last')
+            self._write_cache(cached, symbol, timeframe)
+
+        return cached.tail(periods).reset_index(drop=True)
+
     def _get_timeframe_ms(self, timeframe: str) -> int:
         """Convert timeframe string to milliseconds"""
         unit = timeframe[-1]
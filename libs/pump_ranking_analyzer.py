@@ -72,10 +72,12 @@ class PumpRankingAnalyzer:
         
         # 5. Support/Resistance Analysis (0-100)
         sr_score = 0
-        if latest['nearest_support'] is not None and latest['nearest_resistance'] is not None:
-            price_range = latest['nearest_resistance'] - latest['nearest_support']
+        nearest_support = latest.get('nearest_support')
+        nearest_resistance = latest.get('nearest_resistance')
+        if nearest_support is not None and nearest_resistance is not None:
+            price_range = nearest_resistance - nearest_support
             current_price = latest['close']
-            distance_to_support = (current_price - latest['nearest_support']) / price_range
+            distance_to_support = (current_price - nearest_support) / price_range
             if distance_to_support < 0.2:  # Price near support
                 sr_score = 100
             elif distance_to_support < 0.4:
@@ -1,11 +1,224 @@
 import pandas as pd
 import numpy as np
 import ta
+from numba import njit, prange
 from ta.trend import SMAIndicator, EMAIndicator, MACD, ADXIndicator, IchimokuIndicator
 from ta.momentum import RSIIndicator, StochasticOscillator, WilliamsRIndicator, ROCIndicator
 from ta.volatility import BollingerBands, AverageTrueRange, DonchianChannel
 from ta.volume import VolumeWeightedAveragePrice, MFIIndicator, ChaikinMoneyFlowIndicator
 
+@njit(cache=True)
+def _fused_trend_momentum_vol(close, high, low, rsi_period, bb_period, bb_std,
+                              atr_period):
+    """
+    Single forward pass computing SMA/EMA/MACD/RSI/Bollinger/ATR/volatility
+
+    Fuses the rolling passes of analyze_trend, analyze_momentum and
+    analyze_volatility into one loop over the price arrays, so the
+    cache lines are walked once instead of once per indicator family.
+    Matches the ta-library seeding conventions (EMA recursion from bar 0
+    with NaN below min_periods, Wilder RSI with zeroed first diff,
+    SMA-seeded Wilder ATR, Bollinger std with ddof=0).
+    """
+    n = close.shape[0]
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_200 = np.full(n, np.nan)
+    ema_20 = np.full(n, np.nan)
+    ema_50 = np.full(n, np.nan)
+    ema_200 = np.full(n, np.nan)
+    macd = np.full(n, np.nan)
+    macd_signal = np.full(n, np.nan)
+    macd_diff = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    bb_upper = np.full(n, np.nan)
+    bb_middle = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+    atr = np.zeros(n)
+    volatility = np.full(n, np.nan)
+
+    if n == 0:
+        return (sma_20, sma_50, sma_200, ema_20, ema_50, ema_200,
+                macd, macd_signal, macd_diff, rsi,
+                bb_upper, bb_middle, bb_lower, atr, volatility)
+
+    # Running accumulators
+    sum_20 = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    sum_bb = 0.0
+    sum_bb2 = 0.0
+    sum_v = 0.0
+    sum_v2 = 0.0
+
+    a20 = 2.0 / 21.0
+    a50 = 2.0 / 51.0
+    a200 = 2.0 / 201.0
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    a_rsi = 1.0 / rsi_period
+
+    e20 = close[0]
+    e50 = close[0]
+    e200 = close[0]
+    e12 = close[0]
+    e26 = close[0]
+    sig = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    atr_v = 0.0
+    tr_seed = 0.0
+
+    vol_window = 20
+
+    for i in range(n):
+        c = close[i]
+
+        # Simple moving averages via running sums
+        sum_20 += c
+        if i >= 20:
+            sum_20 -= close[i - 20]
+        if i >= 19:
+            sma_20[i] = sum_20 / 20.0
+
+        sum_50 += c
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 49:
+            sma_50[i] = sum_50 / 50.0
+
+        sum_200 += c
+        if i >= 200:
+            sum_200 -= close[i - 200]
+        if i >= 199:
+            sma_200[i] = sum_200 / 200.0
+
+        # Exponential moving averages (adjust=False recursion)
+        if i > 0:
+            e20 = a20 * c + (1.0 - a20) * e20
+            e50 = a50 * c + (1.0 - a50) * e50
+            e200 = a200 * c + (1.0 - a200) * e200
+            e12 = a12 * c + (1.0 - a12) * e12
+            e26 = a26 * c + (1.0 - a26) * e26
+        if i >= 19:
+            ema_20[i] = e20
+        if i >= 49:
+            ema_50[i] = e50
+        if i >= 199:
+            ema_200[i] = e200
+
+        # MACD 12/26 with 9-period signal (signal recursion starts at the
+        # first valid MACD value, index 25)
+        m = e12 - e26
+        if i >= 25:
+            macd[i] = m
+            if i == 25:
+                sig = m
+            else:
+                sig = a9 * m + (1.0 - a9) * sig
+            if i >= 33:
+                macd_signal[i] = sig
+                macd_diff[i] = m - sig
+
+        # RSI with Wilder smoothing (first diff treated as zero gain/loss)
+        if i > 0:
+            d = c - close[i - 1]
+            gain = d if d > 0 else 0.0
+            loss = -d if d < 0 else 0.0
+            avg_gain = a_rsi * gain + (1.0 - a_rsi) * avg_gain
+            avg_loss = a_rsi * loss + (1.0 - a_rsi) * avg_loss
+        if i >= rsi_period - 1:
+            if avg_loss == 0.0:
+                rsi[i] = 100.0
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # Bollinger Bands via running sum/sum-of-squares (ddof=0)
+        sum_bb += c
+        sum_bb2 += c * c
+        if i >= bb_period:
+            old = close[i - bb_period]
+            sum_bb -= old
+            sum_bb2 -= old * old
+        if i >= bb_period - 1:
+            mean = sum_bb / bb_period
+            var = sum_bb2 / bb_period - mean * mean
+            if var < 0.0:
+                var = 0.0
+            sd = np.sqrt(var)
+            bb_middle[i] = mean
+            bb_upper[i] = mean + bb_std * sd
+            bb_lower[i] = mean - bb_std * sd
+
+        # ATR: true range then SMA-seeded Wilder smoothing
+        if i == 0:
+            tr = high[0] - low[0]
+        else:
+            tr = high[i] - low[i]
+            d1 = abs(high[i] - close[i - 1])
+            d2 = abs(low[i] - close[i - 1])
+            if d1 > tr:
+                tr = d1
+            if d2 > tr:
+                tr = d2
+        if i < atr_period:
+            tr_seed += tr
+            if i == atr_period - 1:
+                atr_v = tr_seed / atr_period
+                atr[i] = atr_v
+        else:
+            atr_v = (atr_v * (atr_period - 1) + tr) / atr_period
+            atr[i] = atr_v
+
+        # Rolling 20-bar std of percent returns (ddof=1)
+        if i > 0:
+            p = c / close[i - 1] - 1.0
+            sum_v += p
+            sum_v2 += p * p
+            if i > vol_window:
+                old_p = close[i - vol_window] / close[i - vol_window - 1] - 1.0
+                sum_v -= old_p
+                sum_v2 -= old_p * old_p
+            if i >= vol_window:
+                var = (sum_v2 - sum_v * sum_v / vol_window) / (vol_window - 1)
+                if var < 0.0:
+                    var = 0.0
+                volatility[i] = np.sqrt(var)
+
+    return (sma_20, sma_50, sma_200, ema_20, ema_50, ema_200,
+            macd, macd_signal, macd_diff, rsi,
+            bb_upper, bb_middle, bb_lower, atr, volatility)
+
+# Output order of the fused kernels
+_FUSED_COLUMNS = ('sma_20', 'sma_50', 'sma_200', 'ema_20', 'ema_50',
+                  'ema_200', 'macd', 'macd_signal', 'macd_diff', 'rsi',
+                  'bb_upper', 'bb_middle', 'bb_lower', 'atr', 'volatility')
+
+@njit(cache=True, parallel=True)
+def _fused_batch(closes, highs, lows, lengths, rsi_period, bb_period, bb_std,
+                 atr_period):
+    """
+    Run the fused indicator pass for many symbols in one call
+
+    Inputs are (n_symbols, n_bars) matrices, left-aligned and NaN-padded
+    to the longest history; lengths gives the valid prefix per row. The
+    symbol axis runs in parallel (prange), amortizing the Python call
+    overhead once across the whole universe.
+    """
+    n_symbols, n_bars = closes.shape
+    out = np.full((15, n_symbols, n_bars), np.nan)
+
+    for s in prange(n_symbols):
+        m = lengths[s]
+        res = _fused_trend_momentum_vol(closes[s, :m], highs[s, :m],
+                                        lows[s, :m], rsi_period, bb_period,
+                                        bb_std, atr_period)
+        for k in range(len(res)):
+            out[k, s, :m] = res[k]
+
+    return out
+
 class TechnicalAnalyzer:
     def __init__(self):
         """Initialize TechnicalAnalyzer with default parameters"""
@@ -23,6 +236,10 @@ class TechnicalAnalyzer:
         # Fibonacci levels
         self.fib_retracement_levels = [0, 0.236, 0.382, 0.5, 0.618, 0.786, 1]
         self.fib_extension_levels = [1.272, 1.618, 2.618, 3.618, 4.236]
+
+        # Ratio arrays for broadcast level computation
+        self._fib_retracement_ratios = np.asarray(self.fib_retracement_levels, dtype=np.float64)
+        self._fib_extension_ratios = np.asarray(self.fib_extension_levels, dtype=np.float64)
         
         # Scoring weights
         self.weights = {
@@ -97,23 +314,30 @@ class TechnicalAnalyzer:
         
         # Calculate price range
         df['price_range'] = df['swing_high'] - df['swing_low']
-        
-        # Calculate Fibonacci Retracement levels
-        for level in self.fib_retracement_levels:
-            if level == 0:
-                df[f'fib_retracement_{int(level*1000)}'] = df['swing_high']
-            elif level == 1:
-                df[f'fib_retracement_{int(level*1000)}'] = df['swing_low']
-            else:
-                df[f'fib_retracement_{int(level*1000)}'] = df['swing_high'] - (df['price_range'] * level)
-        
-        # Calculate Fibonacci Extension levels
-        for level in self.fib_extension_levels:
-            df[f'fib_extension_{int(level*1000)}'] = df['swing_low'] - (df['price_range'] * (level - 1))
-        
+
+        swing_high = df['swing_high'].to_numpy(copy=False)
+        swing_low = df['swing_low'].to_numpy(copy=False)
+        price_range = df['price_range'].to_numpy(copy=False)
+
+        # All retracement/extension levels in two broadcast ops; the old
+        # level==0/level==1 special cases are identities of the same
+        # formula, so the computation is branchless
+        retracements = swing_high[:, None] - price_range[:, None] * self._fib_retracement_ratios
+        extensions = swing_low[:, None] - price_range[:, None] * (self._fib_extension_ratios - 1)
+
+        level_cols = {
+            f'fib_retracement_{int(level*1000)}': retracements[:, j]
+            for j, level in enumerate(self.fib_retracement_levels)
+        }
+        level_cols.update({
+            f'fib_extension_{int(level*1000)}': extensions[:, j]
+            for j, level in enumerate(self.fib_extension_levels)
+        })
+        df = df.assign(**level_cols)
+
         # Calculate current Fibonacci position
         df['fib_position'] = self._calculate_fib_position(df)
-        
+
         return df
 
     def _calculate_fib_position(self, df):
@@ -126,23 +350,24 @@ class TechnicalAnalyzer:
         Returns:
             float: Position relative to Fibonacci levels (0-1)
         """
-        current_price = df['close'].iloc[-1]
-        swing_high = df['swing_high'].iloc[-1]
-        swing_low = df['swing_low'].iloc[-1]
-        
-        if current_price > swing_high:
-            # Price is above swing high, calculate extension position
-            extension_range = current_price - swing_high
-            total_range = swing_high - swing_low
-            return 1 + (extension_range / total_range)
-        elif current_price < swing_low:
-            # Price is below swing low, calculate extension position
-            extension_range = swing_low - current_price
-            total_range = swing_high - swing_low
-            return -(extension_range / total_range)
-        else:
-            # Price is between swing high and low, calculate retracement position
-            return (swing_high - current_price) / (swing_high - swing_low)
+        # Single positional scalar reads (no label resolution)
+        current_price = df['close'].iat[-1]
+        swing_high = df['swing_high'].iat[-1]
+        swing_low = df['swing_low'].iat[-1]
+        total_range = swing_high - swing_low
+
+        # Branchless select: >1 above the swing high (extension), <0 below
+        # the swing low, else retracement position within the range
+        position = np.where(
+            current_price > swing_high,
+            1 + (current_price - swing_high) / total_range,
+            np.where(
+                current_price < swing_low,
+                -((swing_low - current_price) / total_range),
+                (swing_high - current_price) / total_range
+            )
+        )
+        return float(position)
 
     def get_fibonacci_levels(self, df):
         """
@@ -154,25 +379,26 @@ class TechnicalAnalyzer:
         Returns:
             dict: Current Fibonacci levels
         """
-        current_price = df['close'].iloc[-1]
+        # Pull the last row once instead of one column indexer per level
+        last = df.iloc[-1]
         levels = {
             'retracement': {},
             'extension': {},
-            'position': df['fib_position'].iloc[-1]
+            'position': last['fib_position']
         }
-        
+
         # Get retracement levels
         for level in self.fib_retracement_levels:
             level_key = f'fib_retracement_{int(level*1000)}'
-            if level_key in df.columns:
-                levels['retracement'][f'{level:.3f}'] = df[level_key].iloc[-1]
-        
+            if level_key in last.index:
+                levels['retracement'][f'{level:.3f}'] = last[level_key]
+
         # Get extension levels
         for level in self.fib_extension_levels:
             level_key = f'fib_extension_{int(level*1000)}'
-            if level_key in df.columns:
-                levels['extension'][f'{level:.3f}'] = df[level_key].iloc[-1]
-        
+            if level_key in last.index:
+                levels['extension'][f'{level:.3f}'] = last[level_key]
+
         return levels
 
     def analyze_momentum(self, df):
@@ -235,6 +461,125 @@ class TechnicalAnalyzer:
         
         return df
 
+    def fused_analyze(self, df):
+        """
+        Run trend, momentum, volatility and pattern analysis in one pass
+
+        Replaces the chained analyze_trend -> analyze_momentum ->
+        analyze_volatility -> detect_candle_patterns calls: the rolling
+        indicators they share come out of a single fused Numba kernel
+        over the price arrays, and only the indicators without a
+        streaming formulation (ADX, Ichimoku, Stochastic, Williams %R,
+        ROC, Donchian) still go through ta.
+
+        Args:
+            df (pandas.DataFrame): DataFrame with OHLCV data
+
+        Returns:
+            pandas.DataFrame: DataFrame with all analysis results
+        """
+        close = df['close'].to_numpy(dtype=np.float64)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+
+        outputs = _fused_trend_momentum_vol(close, high, low, self.rsi_period,
+                                            self.bb_period, float(self.bb_std),
+                                            self.atr_period)
+        # One batched column attach instead of sixteen single inserts
+        df = df.assign(**dict(zip(_FUSED_COLUMNS, outputs)))
+        df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
+
+        return self.analyze_residual(df)
+
+    def fused_analyze_batch(self, dfs):
+        """
+        Batch the fused indicator pass across many symbols at once
+
+        Stacks the per-symbol price histories into (n_symbols, n_bars)
+        matrices and runs one parallel kernel call over the symbol axis,
+        assigning the kernel columns back into each DataFrame in place.
+        The residual per-symbol analysis (analyze_residual, patterns)
+        still runs downstream.
+
+        Args:
+            dfs (list): List of DataFrames with OHLCV data
+
+        Returns:
+            list: The same DataFrames with the fused columns assigned
+        """
+        if not dfs:
+            return dfs
+
+        lengths = np.array([len(df) for df in dfs], dtype=np.int64)
+        n_bars = int(lengths.max())
+        closes = np.full((len(dfs), n_bars), np.nan)
+        highs = np.full((len(dfs), n_bars), np.nan)
+        lows = np.full((len(dfs), n_bars), np.nan)
+        for s, df in enumerate(dfs):
+            closes[s, :lengths[s]] = df['close'].to_numpy(dtype=np.float64)
+            highs[s, :lengths[s]] = df['high'].to_numpy(dtype=np.float64)
+            lows[s, :lengths[s]] = df['low'].to_numpy(dtype=np.float64)
+
+        out = _fused_batch(closes, highs, lows, lengths, self.rsi_period,
+                           self.bb_period, float(self.bb_std),
+                           self.atr_period)
+
+        for s, df in enumerate(dfs):
+            m = lengths[s]
+            # Single multi-column write (keeps the in-place mutation the
+            # callers rely on, without fifteen separate inserts)
+            df[list(_FUSED_COLUMNS)] = out[:, s, :m].T
+            df['bb_width'] = (df['bb_upper'] - df['bb_lower']) / df['bb_middle']
+
+        return dfs
+
+    def analyze_residual(self, df):
+        """
+        Compute the indicators not covered by the fused kernel
+
+        Args:
+            df (pandas.DataFrame): DataFrame that already carries the
+                fused kernel columns
+
+        Returns:
+            pandas.DataFrame: DataFrame with all analysis results
+        """
+        # Indicators without a single-pass formulation; collected into one
+        # batched assign so the block manager reorganizes once, not per column
+        adx = ADXIndicator(df['high'], df['low'], df['close'])
+        ichimoku = IchimokuIndicator(df['high'], df['low'])
+        stoch = StochasticOscillator(df['high'], df['low'], df['close'],
+                                     window=self.stoch_period,
+                                     smooth_window=self.stoch_smooth)
+        donchian = DonchianChannel(df['high'], df['low'], df['close'])
+        df = df.assign(
+            adx=adx.adx(),
+            adx_pos=adx.adx_pos(),
+            adx_neg=adx.adx_neg(),
+            ichimoku_a=ichimoku.ichimoku_a(),
+            ichimoku_b=ichimoku.ichimoku_b(),
+            ichimoku_base=ichimoku.ichimoku_base_line(),
+            ichimoku_conv=ichimoku.ichimoku_conversion_line(),
+            stoch_k=stoch.stoch(),
+            stoch_d=stoch.stoch_signal(),
+            williams_r=WilliamsRIndicator(df['high'], df['low'], df['close']).williams_r(),
+            roc=ROCIndicator(df['close']).roc(),
+            dc_upper=donchian.donchian_channel_hband(),
+            dc_lower=donchian.donchian_channel_lband(),
+            dc_middle=donchian.donchian_channel_mband()
+        )
+
+        # Fibonacci levels
+        df = self.calculate_fibonacci_levels(df)
+
+        # Trend Strength
+        df['trend_strength'] = self._calculate_trend_strength(df)
+
+        # Candle patterns
+        df = self.detect_candle_patterns(df)
+
+        return df
+
     def analyze_volume(self, df):
         """
         Analyze volume patterns
@@ -246,36 +591,36 @@ class TechnicalAnalyzer:
             pandas.DataFrame: DataFrame with volume analysis
         """
         # Volume Moving Average
-        df['volume_sma_20'] = SMAIndicator(df['volume'], window=20).sma_indicator()
-        
-        # Volume trend
-        df['volume_trend'] = df['volume'] / df['volume_sma_20']
-        
-        # Volume price trend
-        df['volume_price_trend'] = np.where(
-            df['close'] > df['close'].shift(1),
-            df['volume'],
-            -df['volume']
+        volume_sma_20 = SMAIndicator(df['volume'], window=20).sma_indicator()
+
+        # All volume columns attached in one batched assign
+        df = df.assign(
+            volume_sma_20=volume_sma_20,
+            # Volume trend
+            volume_trend=df['volume'] / volume_sma_20,
+            # Volume price trend
+            volume_price_trend=np.where(
+                df['close'] > df['close'].shift(1),
+                df['volume'],
+                -df['volume']
+            ),
+            # VWAP
+            vwap=VolumeWeightedAveragePrice(
+                df['high'], df['low'], df['close'], df['volume'],
+                window=self.vwap_period
+            ).volume_weighted_average_price(),
+            # Money Flow Index
+            mfi=MFIIndicator(
+                df['high'], df['low'], df['close'], df['volume'],
+                window=self.mfi_period
+            ).money_flow_index(),
+            # Chaikin Money Flow
+            cmf=ChaikinMoneyFlowIndicator(
+                df['high'], df['low'], df['close'], df['volume'],
+                window=self.cmf_period
+            ).chaikin_money_flow()
         )
-        
-        # VWAP
-        df['vwap'] = VolumeWeightedAveragePrice(
-            df['high'], df['low'], df['close'], df['volume'],
-            window=self.vwap_period
-        ).volume_weighted_average_price()
-        
-        # Money Flow Index
-        df['mfi'] = MFIIndicator(
-            df['high'], df['low'], df['close'], df['volume'],
-            window=self.mfi_period
-        ).money_flow_index()
-        
-        # Chaikin Money Flow
-        df['cmf'] = ChaikinMoneyFlowIndicator(
-            df['high'], df['low'], df['close'], df['volume'],
-            window=self.cmf_period
-        ).chaikin_money_flow()
-        
+
         return df
 
     def _calculate_trend_strength(self, df):
@@ -286,23 +631,27 @@ class TechnicalAnalyzer:
             float: Trend strength score (0-100)
         """
         strength = 0
-        
+
+        # One last-row extraction instead of eleven column indexer setups
+        last = df[['close', 'sma_20', 'sma_50', 'sma_200',
+                   'macd', 'macd_signal']].iloc[-1].to_dict()
+
         # Price above/below moving averages
-        if df['close'].iloc[-1] > df['sma_20'].iloc[-1]:
+        if last['close'] > last['sma_20']:
             strength += 20
-        if df['close'].iloc[-1] > df['sma_50'].iloc[-1]:
+        if last['close'] > last['sma_50']:
             strength += 20
-        if df['close'].iloc[-1] > df['sma_200'].iloc[-1]:
+        if last['close'] > last['sma_200']:
             strength += 20
-            
+
         # MACD signal
-        if df['macd'].iloc[-1] > df['macd_signal'].iloc[-1]:
+        if last['macd'] > last['macd_signal']:
             strength += 20
-            
+
         # Moving average alignment
-        if df['sma_20'].iloc[-1] > df['sma_50'].iloc[-1] > df['sma_200'].iloc[-1]:
+        if last['sma_20'] > last['sma_50'] > last['sma_200']:
             strength += 20
-            
+
         return strength
 
     def detect_candle_patterns(self, df):
@@ -315,20 +664,36 @@ class TechnicalAnalyzer:
         Returns:
             pandas.DataFrame: DataFrame with pattern detection results
         """
-        # Calculate body and shadows
-        df['body'] = df['close'] - df['open']
-        df['upper_shadow'] = df['high'] - df[['open', 'close']].max(axis=1)
-        df['lower_shadow'] = df[['open', 'close']].min(axis=1) - df['low']
-        df['body_size'] = abs(df['body'])
-        
-        # Detect patterns
-        df['doji'] = self._is_doji(df)
-        df['hammer'] = self._is_hammer(df)
-        df['shooting_star'] = self._is_shooting_star(df)
-        df['engulfing'] = self._is_engulfing(df)
-        df['morning_star'] = self._is_morning_star(df)
-        df['evening_star'] = self._is_evening_star(df)
-        
+        # Calculate body and shadows (one batched attach)
+        df = df.assign(
+            body=df['close'] - df['open'],
+            upper_shadow=df['high'] - df[['open', 'close']].max(axis=1),
+            lower_shadow=df[['open', 'close']].min(axis=1) - df['low']
+        )
+        df = df.assign(body_size=df['body'].abs())
+
+        # Detect patterns (one batched attach)
+        df = df.assign(
+            doji=self._is_doji(df),
+            hammer=self._is_hammer(df),
+            shooting_star=self._is_shooting_star(df),
+            engulfing=self._is_engulfing(df),
+            morning_star=self._is_morning_star(df),
+            evening_star=self._is_evening_star(df)
+        )
+
+        # Pack the signal-relevant patterns into one uint8 bitmask so
+        # downstream per-row checks need a single integer test instead of
+        # four column lookups (bit order: hammer, morning_star, engulfing,
+        # doji); the bool_ cast first maps engulfing's ternary -1/0/1
+        # encoding to present/absent
+        df['pattern_bits'] = (
+            df['hammer'].to_numpy(dtype=np.bool_).astype(np.uint8)
+            | (df['morning_star'].to_numpy(dtype=np.bool_).astype(np.uint8) << 1)
+            | (df['engulfing'].to_numpy(dtype=np.bool_).astype(np.uint8) << 2)
+            | (df['doji'].to_numpy(dtype=np.bool_).astype(np.uint8) << 3)
+        )
+
         return df
 
     def _is_doji(self, df):
@@ -409,7 +774,7 @@ class TechnicalAnalyzer:
         df['local_max'] = df['high'].rolling(window=window, center=True).max()
         
         # Get current support and resistance
-        current_price = df['close'].iloc[-1]
+        current_price = df['close'].iat[-1]
         support_levels = df[df['local_min'] < current_price]['local_min'].unique()
         resistance_levels = df[df['local_max'] > current_price]['local_max'].unique()
         
@@ -22,9 +22,14 @@ class VolumeProfileAnalyzer:
         Returns:
             pd.Series: VWAP values
         """
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
-        vwap = (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
-        return vwap
+        high = df['high'].to_numpy(copy=False)
+        low = df['low'].to_numpy(copy=False)
+        close = df['close'].to_numpy(copy=False)
+        volume = df['volume'].to_numpy(copy=False)
+
+        typical_price = (high + low + close) / 3
+        vwap = np.cumsum(typical_price * volume) / np.cumsum(volume)
+        return pd.Series(vwap, index=df.index)
     
     def calculate_volume_profile(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, float, float, float]:
         """
@@ -41,46 +46,33 @@ class VolumeProfileAnalyzer:
             - vah: Value Area High
             - val: Value Area Low
         """
-        # Create price bins
-        price_range = df['high'].max() - df['low'].min()
-        bin_size = price_range / self.num_bins
-        price_bins = np.arange(df['low'].min(), df['high'].max() + bin_size, bin_size)
-        
-        # Calculate volume profile
-        volume_profile = np.zeros(len(price_bins) - 1)
-        for i in range(len(df)):
-            low_idx = np.searchsorted(price_bins, df['low'].iloc[i])
-            high_idx = np.searchsorted(price_bins, df['high'].iloc[i])
-            volume = df['volume'].iloc[i]
-            
-            # Distribute volume across price bins
-            for j in range(low_idx, high_idx):
-                if j < len(volume_profile):
-                    volume_profile[j] += volume
-        
+        close = df['close'].to_numpy(copy=False)
+        volume = df['volume'].to_numpy(copy=False)
+        price_low = df['low'].to_numpy(copy=False).min()
+        price_high = df['high'].to_numpy(copy=False).max()
+
+        # Volume-weighted histogram over the price axis: one vectorized
+        # pass instead of a per-candle Python loop over bins
+        volume_profile, price_bins = np.histogram(
+            close, bins=self.num_bins, range=(price_low, price_high),
+            weights=volume
+        )
+
         # Find VPOC (Volume Point of Control)
         vpoc_idx = np.argmax(volume_profile)
         vpoc = (price_bins[vpoc_idx] + price_bins[vpoc_idx + 1]) / 2
-        
-        # Calculate Value Area (70% of volume)
-        total_volume = np.sum(volume_profile)
-        target_volume = total_volume * 0.7
-        
-        # Find Value Area High and Low
-        sorted_indices = np.argsort(volume_profile)[::-1]
-        cumulative_volume = 0
-        included_bins = set()
-        
-        for idx in sorted_indices:
-            cumulative_volume += volume_profile[idx]
-            included_bins.add(idx)
-            if cumulative_volume >= target_volume:
-                break
-        
-        included_bins = sorted(list(included_bins))
-        val = price_bins[min(included_bins)]
-        vah = price_bins[max(included_bins) + 1]
-        
+
+        # Value Area (70% of volume): take bins in descending volume
+        # order until the cumulative sum crosses the target
+        target_volume = volume_profile.sum() * 0.7
+        order = np.argsort(volume_profile)[::-1]
+        cumulative = np.cumsum(volume_profile[order])
+        cutoff = np.searchsorted(cumulative, target_volume)
+        included_bins = order[:cutoff + 1]
+
+        val = price_bins[included_bins.min()]
+        vah = price_bins[included_bins.max() + 1]
+
         return price_bins, volume_profile, vpoc, vah, val
     
     def analyze(self, df: pd.DataFrame) -> Dict:
@@ -100,11 +92,11 @@ class VolumeProfileAnalyzer:
         price_bins, volume_profile, vpoc, vah, val = self.calculate_volume_profile(df)
         
         # Calculate current price position relative to Value Area
-        current_price = df['close'].iloc[-1]
+        current_price = df['close'].iat[-1]
         va_position = (current_price - val) / (vah - val) if vah != val else 0.5
-        
+
         return {
-            'vwap': df['vwap'].iloc[-1],
+            'vwap': df['vwap'].iat[-1],
             'vpoc': vpoc,
             'vah': vah,
             'val': val,
@@ -1,8 +1,70 @@
+import os
+import copy
+import time
+import queue
+import logging
+import multiprocessing as mp
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from libs.data_fetcher import DataFetcher
 from libs.signal_analyzer import SignalAnalyzer
 from libs.pump_ranking_analyzer import PumpRankingAnalyzer
+from libs.streaming import EMAState, RSIState, ATRState
+
+log = logging.getLogger('pre_pump')
+
+def start_logging_queue():
+    """
+    Route log records through a queue drained by a background listener
+
+    Emitting a record then only costs an enqueue, so stdout writes never
+    block the fetch/analysis threads.
+
+    Returns:
+        logging.handlers.QueueListener: Started listener (call .stop()
+            to flush and shut down)
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, handler)
+
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+# Per-process analyzer singletons for the multiprocessing pool; built
+# once per worker by _worker_init instead of being pickled per task
+_worker_signal_analyzer = None
+_worker_ranking_analyzer = None
+
+def _worker_init():
+    """Build the analyzer singletons once in each pool worker process"""
+    global _worker_signal_analyzer, _worker_ranking_analyzer
+    _worker_signal_analyzer = SignalAnalyzer(warmup=True)
+    _worker_ranking_analyzer = PumpRankingAnalyzer()
+
+def _analyze_one(task):
+    """
+    Analyze one fetched symbol inside a pool worker
+
+    Args:
+        task (tuple): (symbol, DataFrame with the fused indicator core
+            already assigned)
+
+    Returns:
+        tuple: (symbol, DataFrame with analysis results, ranking analysis)
+    """
+    symbol, df = task
+    df = _worker_signal_analyzer.analyze_data(df, precomputed_core=True)
+    df = _worker_signal_analyzer.detect_signals(df)
+    ranking = _worker_ranking_analyzer.analyze_symbol(df)
+    return symbol, df, ranking
 
 class PrePumpDetector:
     def __init__(self, api_key, api_secret):
@@ -14,112 +76,353 @@ class PrePumpDetector:
             api_secret (str): Binance API secret
         """
         self.data_fetcher = DataFetcher(api_key, api_secret)
-        self.signal_analyzer = SignalAnalyzer()
+        self.signal_analyzer = SignalAnalyzer(warmup=True)
         self.ranking_analyzer = PumpRankingAnalyzer()
+
+        # LRU memo of analysis results keyed on the fetched data identity,
+        # so re-scans return in O(1) when no new candle has closed yet
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_size = 2048
+
+        # Per-symbol streaming indicator states: when a re-scan brings in
+        # exactly one new candle, the recursive indicators update in O(1)
+        # and only a bounded tail window is re-analyzed
+        self._stream_states = {}
+        self._stream_window = 250  # covers the largest lookback (sma_200)
     
-    def analyze_symbol(self, symbol, timeframe='1h'):
+    def fetch_with_retry(self, symbol, timeframe='1h', max_retries=3):
         """
-        Analyze a symbol for pre-pump signals and ranking
-        
+        Fetch historical data with exponential backoff on failures
+
         Args:
             symbol (str): Trading pair symbol
             timeframe (str): Candle timeframe
-            
+            max_retries (int): Maximum number of fetch attempts
+
+        Returns:
+            pandas.DataFrame: DataFrame with historical data, or None
+        """
+        delay = 1
+        for attempt in range(max_retries):
+            try:
+                df = self.data_fetcher.get_historical_data(symbol, timeframe)
+                if df is not None:
+                    return df
+            except Exception as e:
+                log.warning("Fetch attempt %d failed for %s: %s", attempt + 1, symbol, e)
+
+            # Back off before retrying (respects HTTP 429 rate limits)
+            if attempt < max_retries - 1:
+                time.sleep(delay)
+                delay *= 2
+
+        return None
+
+    def analyze_dataframe(self, df, precomputed_core=False):
+        """
+        Run the analysis pipeline on already-fetched OHLCV data
+
+        Args:
+            df (pandas.DataFrame): DataFrame with OHLCV data
+            precomputed_core (bool): True when the fused kernel columns
+                were already batch-computed for this frame
+
         Returns:
             tuple: (DataFrame with analysis results, ranking analysis)
         """
-        # Fetch data using DataFetcher
-        df = self.data_fetcher.get_historical_data(symbol, timeframe)
-        if df is None:
-            return None, None
-        
         # Perform technical analysis
-        df = self.signal_analyzer.analyze_data(df)
-        
+        df = self.signal_analyzer.analyze_data(df, precomputed_core=precomputed_core)
+
         # Detect signals
         df = self.signal_analyzer.detect_signals(df)
-        
+
         # Calculate pump ranking
         ranking_analysis = self.ranking_analyzer.analyze_symbol(df)
-        
+
         return df, ranking_analysis
 
+    def _can_stream(self, symbol, df):
+        """
+        Check whether exactly one new candle arrived since the last scan
+
+        Args:
+            symbol (str): Trading pair symbol
+            df (pandas.DataFrame): Freshly fetched OHLCV data
+
+        Returns:
+            bool: True if the streaming fast path can be taken
+        """
+        state = self._stream_states.get(symbol)
+        if state is None or state['last_ts'] is None or len(df) < 2:
+            return False
+        if 'timestamp' not in df.columns:
+            return False
+        return df['timestamp'].iloc[-2] == state['last_ts']
+
+    def _seed_stream_state(self, symbol, df):
+        """
+        (Re)build the streaming indicator states from the closed bars
+
+        Args:
+            symbol (str): Trading pair symbol
+            df (pandas.DataFrame): Full OHLCV history just analyzed
+        """
+        state = {
+            'last_ts': None,
+            'ema_20': EMAState(20),
+            'ema_50': EMAState(50),
+            'ema_200': EMAState(200),
+            'rsi': RSIState(14),
+            'atr': ATRState(14)
+        }
+
+        # Seed on closed bars only: the tail bar is still forming, and
+        # its final values arrive with the next fetch (which re-delivers
+        # it corrected), so it is previewed per scan rather than
+        # committed into the recursions with a mid-bar snapshot
+        closes = df['close'].to_numpy()[:-1]
+        highs = df['high'].to_numpy()[:-1]
+        lows = df['low'].to_numpy()[:-1]
+        state['ema_20'].seed(closes)
+        state['ema_50'].seed(closes)
+        state['ema_200'].seed(closes)
+        state['rsi'].seed(closes)
+        state['atr'].seed(highs, lows, closes)
+
+        self._stream_states[symbol] = state
+
+    def _analyze_streaming(self, symbol, df):
+        """
+        Incremental analysis for a single new candle
+
+        Commits the previous tail bar's now-final values into the
+        recursive indicator states in O(1), re-analyzes only a bounded
+        tail window, and patches the last two rows with the exact
+        streaming values (a tail recompute alone would re-seed the
+        recursive indicators from a truncated history). The forming tail
+        bar is previewed on copies of the states so its mid-bar snapshot
+        never enters the committed recursions.
+
+        Args:
+            symbol (str): Trading pair symbol
+            df (pandas.DataFrame): Freshly fetched OHLCV data
+
+        Returns:
+            tuple: (DataFrame with analysis results, ranking analysis)
+        """
+        state = self._stream_states[symbol]
+
+        # The previous tail bar has closed and the fetch re-delivered it
+        # with final values: commit those into the recursions
+        closed = df.iloc[-2]
+        closed_vals = [
+            state['ema_20'].update(closed['close']),
+            state['ema_50'].update(closed['close']),
+            state['ema_200'].update(closed['close']),
+            state['rsi'].update(closed['close']),
+            state['atr'].update(closed['high'], closed['low'], closed['close'])
+        ]
+
+        # Preview the still-forming tail bar on state copies
+        preview = {name: copy.deepcopy(state[name])
+                   for name in ('ema_20', 'ema_50', 'ema_200', 'rsi', 'atr')}
+        bar = df.iloc[-1]
+        forming_vals = [
+            preview['ema_20'].update(bar['close']),
+            preview['ema_50'].update(bar['close']),
+            preview['ema_200'].update(bar['close']),
+            preview['rsi'].update(bar['close']),
+            preview['atr'].update(bar['high'], bar['low'], bar['close'])
+        ]
+
+        tail = df.tail(self._stream_window).reset_index(drop=True)
+        tail = self.signal_analyzer.analyze_data(tail)
+
+        stream_cols = ['ema_20', 'ema_50', 'ema_200', 'rsi', 'atr']
+        tail.loc[tail.index[-2], stream_cols] = closed_vals
+        tail.loc[tail.index[-1], stream_cols] = forming_vals
+
+        tail = self.signal_analyzer.detect_signals(tail)
+        # Ranking recomputes indicators on the frame it is given, so hand
+        # it a copy to keep the patched exact values in the returned frame
+        ranking_analysis = self.ranking_analyzer.analyze_symbol(tail.copy())
+
+        return tail, ranking_analysis
+
+    def analyze_symbol(self, symbol, timeframe='1h'):
+        """
+        Analyze a symbol for pre-pump signals and ranking
+
+        Args:
+            symbol (str): Trading pair symbol
+            timeframe (str): Candle timeframe
+
+        Returns:
+            tuple: (DataFrame with analysis results, ranking analysis)
+        """
+        # Fetch data using DataFetcher
+        df = self.fetch_with_retry(symbol, timeframe)
+        if df is None:
+            return None, None
+
+        # Cache hit: identical input data (same last candle and length)
+        # gives identical analysis, so skip the recompute entirely
+        last_ts = df['timestamp'].iloc[-1] if 'timestamp' in df.columns else df.index[-1]
+        cache_key = (symbol, timeframe, last_ts, len(df))
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return cached
+
+        if self._can_stream(symbol, df):
+            result = self._analyze_streaming(symbol, df)
+        else:
+            result = self.analyze_dataframe(df)
+            self._seed_stream_state(symbol, df)
+        self._stream_states[symbol]['last_ts'] = last_ts
+
+        self._analysis_cache[cache_key] = result
+        if len(self._analysis_cache) > self._analysis_cache_size:
+            self._analysis_cache.popitem(last=False)
+
+        return result
+
 def main():
     # Your API credentials
     api_key = "jd9uzMfTNlHAsRwzFTpWsepPQ5lcAd4uyD0GFKW0ddZLo4sqPXMIeqN3hjH4KdPi"
     api_secret = "aKINVDzGQFQ8L46fLPISjGK5RiamDtiLIKF6JatXKrTkQTPYUG3ctLAmcRgpqCOc"
     
+    # Start the buffered logging pipeline: records are enqueued by the
+    # worker threads and written to stdout by a background listener
+    listener = start_logging_queue()
+
     # Initialize detector
     detector = PrePumpDetector(api_key, api_secret)
-    
+
     # Get all USDT pairs
-    print("Fetching all USDT pairs from Binance...")
+    log.info("Fetching all USDT pairs from Binance...")
     symbols = detector.data_fetcher.get_all_usdt_pairs()
-    
+
     if not symbols:
-        print("No USDT pairs found or error occurred")
+        log.info("No USDT pairs found or error occurred")
+        listener.stop()
         return
-        
-    print(f"Found {len(symbols)} USDT pairs")
-    
-    # Create a list to store all signals and rankings
-    all_signals = []
+
+    log.info("Found %d USDT pairs", len(symbols))
+
+    # Fetch data for all symbols in parallel (network-bound, so thread
+    # workers overlap the per-request round trips)
+    max_workers = int(os.getenv('SYMBOL_CONCURRENCY', '20'))
+    log.info("Fetching historical data with %d workers...", max_workers)
+
+    fetched = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(detector.fetch_with_retry, symbol): symbol
+                   for symbol in symbols}
+        for i, future in enumerate(as_completed(futures), 1):
+            symbol = futures[future]
+            df = future.result()
+            if df is not None:
+                fetched.append((symbol, df))
+            else:
+                log.info("No data for %s (%d/%d)", symbol, i, len(symbols))
+
+    log.info("Fetched data for %d symbols", len(fetched))
+
+    # Batch-compute the fused indicator core for the whole universe in a
+    # single parallel kernel call over a (n_symbols, n_bars) stack
+    detector.signal_analyzer.technical_analyzer.fused_analyze_batch(
+        [df for _, df in fetched])
+
+    # Signals land in one preallocated record buffer (at most 5 rows per
+    # symbol) that is row-filled in place, so no intermediate DataFrames
+    # pile up for a final concat; rankings stay a list of dicts
+    signals_buf = None
+    signals_count = 0
     all_rankings = []
-    
-    # Analyze each symbol
-    for i, symbol in enumerate(symbols, 1):
-        print(f"\nAnalyzing {symbol} ({i}/{len(symbols)})...")
-        
-        # Analyze symbol
-        df, ranking = detector.analyze_symbol(symbol)
-        
-        if df is not None and ranking is not None:
-            # Get the latest signals
-            latest_signals = df[df['pre_pump_signal']].tail(5)
-            
-            if not latest_signals.empty:
-                print(f"\nPre-pump signals detected for {symbol}:")
-                for _, signal in latest_signals.iterrows():
-                    # Format and print signal information
-                    signal_info = detector.signal_analyzer.format_signal_output(signal)
-                    for key, value in signal_info.items():
-                        print(f"{key.replace('_', ' ').title()}: {value}")
-                    print("---")
-                
-                # Add signals to the list
-                latest_signals['symbol'] = symbol
-                all_signals.append(latest_signals)
-                
-                # Add ranking to the list
-                ranking['symbol'] = symbol
-                all_rankings.append(ranking)
-    
-    # Save all signals to CSV
-    if all_signals:
-        combined_signals = pd.concat(all_signals)
+
+    # Analyze each symbol across all cores: the residual pandas analysis
+    # is GIL-bound, so a process pool gives real parallelism; workers are
+    # seeded once via the initializer and tasks arrive in chunks to
+    # amortize the pickling round trips
+    # Spawn (not fork) the workers: the fused batch kernel above runs
+    # Numba's parallel threading layer in this process, which is not
+    # fork-safe and deadlocks forked children at exit
+    analysis_workers = int(os.getenv('ANALYSIS_WORKERS', str(os.cpu_count() or 1)))
+    with mp.get_context('spawn').Pool(analysis_workers, initializer=_worker_init) as pool:
+        results = pool.imap_unordered(_analyze_one, fetched, chunksize=8)
+        for i, (symbol, df, ranking) in enumerate(results, 1):
+            # Lazy %-formatting: the message is only rendered if the
+            # record actually gets emitted
+            log.info("\nAnalyzed %s (%d/%d)", symbol, i, len(fetched))
+
+            if df is not None and ranking is not None:
+                # Get the latest signals
+                latest_signals = df[df['pre_pump_signal']].tail(5)
+
+                if not latest_signals.empty:
+                    log.info("\nPre-pump signals detected for %s:", symbol)
+                    # Plain tuples instead of iterrows' per-row Series boxing
+                    signal_cols = latest_signals.columns.tolist()
+                    for row in latest_signals.itertuples(index=False, name=None):
+                        # Format and log signal information
+                        signal_info = detector.signal_analyzer.format_signal_output(
+                            dict(zip(signal_cols, row)))
+                        for key, value in signal_info.items():
+                            log.info("%s: %s", key.replace('_', ' ').title(), value)
+                        log.info("---")
+
+                    # Bulk-copy the signal rows into the record buffer
+                    records = latest_signals.assign(symbol=symbol).to_records(index=False)
+                    if signals_buf is None:
+                        signals_buf = np.empty(len(fetched) * 5, dtype=records.dtype)
+                    signals_buf[signals_count:signals_count + len(records)] = records
+                    signals_count += len(records)
+
+                    # Add ranking to the list
+                    ranking['symbol'] = symbol
+                    all_rankings.append(ranking)
+
+    # Save all signals to CSV; Arrow-backed dtypes store the strings and
+    # floats columnar instead of as boxed Python objects
+    if signals_count:
+        combined_signals = pd.DataFrame.from_records(
+            signals_buf[:signals_count]).convert_dtypes(dtype_backend='pyarrow')
         filename = detector.signal_analyzer.save_signals_to_csv(combined_signals)
-        print(f"\nAll signals saved to {filename}")
-        
-        # Save rankings to CSV and display sorted rankings
-        rankings_df = pd.DataFrame(all_rankings)
+        log.info("\nAll signals saved to %s", filename)
         
+        # Save rankings to CSV and display sorted rankings; total_score is
+        # lifted out of the scores dicts before the DataFrame is built, so
+        # no per-row Series.apply is needed for the sort
+        for ranking in all_rankings:
+            ranking['total_score'] = ranking['scores']['total_score']
+        # Arrow backend for the scalar columns (the nested scores and
+        # recommendation dicts stay object, which also rules out a
+        # pyarrow.csv handoff for this frame)
+        rankings_df = pd.DataFrame(all_rankings).convert_dtypes(dtype_backend='pyarrow')
+
         # Sort rankings by total score in descending order
-        rankings_df['total_score'] = rankings_df['scores'].apply(lambda x: x['total_score'])
         rankings_df = rankings_df.sort_values(by='total_score', ascending=False)
         
         # Display rankings
-        print("\n=== RANKINGS FROM HIGHEST TO LOWEST ===")
+        log.info("\n=== RANKINGS FROM HIGHEST TO LOWEST ===")
         for idx, (_, row) in enumerate(rankings_df.iterrows(), 1):
-            print(f"\nRank #{idx}: {row['symbol']}")
-            print(detector.ranking_analyzer.format_ranking_output(row))
-            print("-" * 50)
+            log.info("\nRank #%d: %s", idx, row['symbol'])
+            log.info("%s", detector.ranking_analyzer.format_ranking_output(row))
+            log.info("-" * 50)
         
         # Save to CSV
         rankings_filename = f"pump_rankings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        rankings_df.to_csv(rankings_filename, index=False)
-        print(f"\nAll rankings saved to {rankings_filename}")
+        # Buffered, chunked write with compact float formatting (full
+        # 17-digit reprs roughly double the bytes pushed to disk)
+        with open(rankings_filename, 'w', buffering=1 << 20, newline='') as f:
+            rankings_df.to_csv(f, index=False, float_format='%.6g', chunksize=10000)
+        log.info("\nAll rankings saved to %s", rankings_filename)
     else:
-        print("\nNo pre-pump signals detected for any symbol")
+        log.info("\nNo pre-pump signals detected for any symbol")
+
+    # Flush any queued records before exiting
+    listener.stop()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
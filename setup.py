@@ -22,6 +22,8 @@ setup(
     install_requires=[
         "pandas",
         "numpy",
+        "numba",
+        "pyarrow",
         "yfinance",
         "ta",
         "requests",